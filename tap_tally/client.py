@@ -2,20 +2,59 @@
 
 from __future__ import annotations
 
-from typing import Any, override
+import decimal
+from typing import TYPE_CHECKING, Any, override
 
+import msgspec
 from singer_sdk import SchemaDirectory, StreamSchema
-from singer_sdk.authenticators import BearerTokenAuthenticator
+from singer_sdk.helpers.jsonpath import extract_jsonpath
+from singer_sdk.pagination import PageNumberPaginator
 from singer_sdk.streams import RESTStream
 
 from tap_tally import schemas
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import requests
+    from singer_sdk.authenticators import BearerTokenAuthenticator
+
+    from tap_tally.tap import TapTally
+
 SCHEMAS_DIR = SchemaDirectory(schemas)
 
+# Same number handling as the SDK's default `response.json(parse_float=decimal.Decimal)`
+JSON_DECODER = msgspec.json.Decoder(float_hook=decimal.Decimal)
+
+
+class _Page(msgspec.Struct, rename="camel"):
+    """Pagination fields of a Tally list response."""
+
+    has_more: bool = True
+
+
+class TallyPaginator(PageNumberPaginator):
+    """Page number paginator that stops as soon as the API reports there are no more pages.
+
+    Only for list endpoints that respond with a JSON object, such as ``{"items": [...]}``.
+    Array bodies fail to decode. Without a ``hasMore`` field, the SDK stops on the first
+    empty page.
+    """
+
+    def __init__(self) -> None:
+        """Start from the first page."""
+        super().__init__(start_value=1)
+
+    @override
+    def has_more(self, response: requests.Response) -> bool:
+        return msgspec.json.decode(response.content, type=_Page).has_more
+
 
 class TallyStream(RESTStream[Any]):
     """Tally stream class."""
 
+    _tap: TapTally
+
     records_jsonpath = "$[*]"
     schema = StreamSchema(SCHEMAS_DIR)
 
@@ -27,4 +66,16 @@ class TallyStream(RESTStream[Any]):
     @override
     @property
     def authenticator(self) -> BearerTokenAuthenticator:
-        return BearerTokenAuthenticator(token=self.config["api_key"])
+        return self._tap.authenticator
+
+    @override
+    @property
+    def requests_session(self) -> requests.Session:
+        return self._tap.requests_session
+
+    @override
+    def parse_response(self, response: requests.Response) -> Iterable[dict[str, Any]]:
+        yield from extract_jsonpath(
+            self.records_jsonpath,
+            input=JSON_DECODER.decode(response.content),
+        )
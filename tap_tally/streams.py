@@ -2,16 +2,22 @@
 
 from __future__ import annotations
 
+import collections
+import decimal
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from functools import cached_property
 from typing import TYPE_CHECKING, Any, override
 
-import requests
+import msgspec
 from singer_sdk import typing as th  # JSON Schema typing helpers
-from singer_sdk.pagination import PageNumberPaginator
+from singer_sdk.pagination import SinglePagePaginator
 
-from tap_tally.client import TallyStream
+from tap_tally.client import TallyPaginator, TallyStream
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import requests
     from singer_sdk.helpers.types import Context
 
 
@@ -23,9 +29,12 @@ class _OrganizationStream(TallyStream):
     def partitions(self) -> list[dict[str, Any]] | None:
         org_ids: list[str] = self.config.get("organization_ids", [])
         if not org_ids:
-            user_info_request = requests.Request(method="GET", url=f"{self.url_base}/users/me")
-            prepared_request = user_info_request.prepare()
-            response = self._request(prepared_request, None)
+            response = self.requests_session.get(
+                f"{self.url_base}/users/me",
+                auth=self.authenticator,
+                headers=self.http_headers,
+                timeout=self.timeout,
+            )
             response.raise_for_status()
             me = response.json()
             org_ids = [me["organizationId"]]
@@ -83,6 +92,8 @@ class FormsStream(_OrganizationStream):
     """Forms stream."""
 
     PAGE_SIZE = 500
+    # Kept below the connection pool size of TapTally.requests_session
+    PREFETCH_WORKERS = 8
 
     records_jsonpath = "$.items[*]"
 
@@ -109,8 +120,8 @@ class FormsStream(_OrganizationStream):
     ).to_dict()
 
     @override
-    def get_new_paginator(self) -> PageNumberPaginator:
-        return PageNumberPaginator(start_value=1)
+    def get_new_paginator(self) -> TallyPaginator:
+        return TallyPaginator()
 
     @override
     def get_url_params(
@@ -123,11 +134,90 @@ class FormsStream(_OrganizationStream):
             params["page"] = next_page_token
         return params
 
+    @override
+    def get_child_context(self, record: dict[str, Any], context: Context | None) -> dict[str, Any]:
+        return {"formId": record["id"]}
 
-class QuestionsStream(TallyStream):
-    """Questions stream."""
+    @override
+    def get_records(self, context: Context | None) -> Iterable[dict[str, Any]]:
+        # Hold back up to PREFETCH_WORKERS forms while their children's first pages are fetched
+        children = [
+            child
+            for child in self.child_streams
+            if isinstance(child, _FormStream) and (child.selected or child.has_selected_descendents)
+        ]
+        if not children:
+            yield from super().get_records(context)
+            return
+
+        executor = ThreadPoolExecutor(
+            max_workers=self.PREFETCH_WORKERS,
+            thread_name_prefix=f"{self.name}-prefetch",
+        )
+        try:
+            window: collections.deque[dict[str, Any]] = collections.deque()
+            for record in super().get_records(context):
+                child_context = self.get_child_context(record, context)
+                for child in children:
+                    child.prefetch_first_page(executor, child_context)
+                window.append(record)
+                if len(window) == self.PREFETCH_WORKERS:
+                    yield window.popleft()
+            yield from window
+        finally:
+            executor.shutdown(cancel_futures=True)
+            for child in children:
+                child.discard_prefetched()
+
+
+class _FormStream(TallyStream):
+    """Base class for streams of resources that belong to a form."""
 
     parent_stream_type = FormsStream
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._prefetched: dict[str | None, Future[requests.Response]] = {}
+
+    def prefetch_first_page(self, executor: Executor, context: Context) -> None:
+        """Start requesting the first page of a form's records in the background.
+
+        Only the first page is prefetched. The SDK picks it up through `_request` when the form
+        is synced, and requests any further pages itself.
+
+        Args:
+            executor: Executor to run the request in.
+            context: Child context of the form.
+        """
+        paginator = self.get_new_paginator() or SinglePagePaginator()
+        prepared_request = self._prepare_request(context=context, page=paginator)
+        request = super()._request
+        self._prefetched[prepared_request.url] = executor.submit(
+            request,
+            prepared_request,
+            context,
+        )
+
+    def discard_prefetched(self) -> None:
+        """Drop prefetched pages that were never synced."""
+        self._prefetched.clear()
+
+    @override
+    def _request(
+        self,
+        prepared_request: requests.PreparedRequest,
+        context: Context | None = None,
+    ) -> requests.Response:
+        # A failed prefetch is retried by the SDK's backoff decorator with a regular request
+        future = self._prefetched.pop(prepared_request.url, None)
+        if future is None:
+            return super()._request(prepared_request, context)
+        return future.result()
+
+
+class QuestionsStream(_FormStream):
+    """Questions stream."""
+
     records_jsonpath = "$.questions[*]"
 
     name = "questions"
@@ -158,13 +248,20 @@ class QuestionsStream(TallyStream):
     ).to_dict()
 
 
-class SubmissionsStream(TallyStream):
+class _SubmissionsPage(msgspec.Struct):
+    """Records of a submissions response, leaving out the form questions sent along with them."""
+
+    submissions: list[dict[str, Any]] = []
+
+
+class SubmissionsStream(_FormStream):
     """Submissions stream."""
 
+    PAGE_SIZE = 500
     SUBMISSION_FILTER = "all"
 
-    parent_stream_type = FormsStream
-    records_jsonpath = "$.submissions[*]"
+    # parse_response decodes `submissions` with this instead of using records_jsonpath
+    _decoder = msgspec.json.Decoder(_SubmissionsPage, float_hook=decimal.Decimal)
 
     name = "submissions"
     path = "/forms/{formId}/submissions"
@@ -187,8 +284,8 @@ class SubmissionsStream(TallyStream):
     ).to_dict()
 
     @override
-    def get_new_paginator(self) -> PageNumberPaginator:
-        return PageNumberPaginator(start_value=1)
+    def get_new_paginator(self) -> TallyPaginator:
+        return TallyPaginator()
 
     @override
     def get_url_params(
@@ -196,11 +293,15 @@ class SubmissionsStream(TallyStream):
         context: Context | None,
         next_page_token: int | None,
     ) -> dict[str, Any]:
-        params: dict[str, Any] = {"filter": self.SUBMISSION_FILTER}
+        params: dict[str, Any] = {"limit": self.PAGE_SIZE, "filter": self.SUBMISSION_FILTER}
         if next_page_token is not None:
             params["page"] = next_page_token
         return params
 
+    @override
+    def parse_response(self, response: requests.Response) -> Iterable[dict[str, Any]]:
+        yield from self._decoder.decode(response.content).submissions
+
 
 class WorkspacesStream(TallyStream):
     """Workspaces stream."""
@@ -253,8 +354,8 @@ class WorkspacesStream(TallyStream):
     ).to_dict()
 
     @override
-    def get_new_paginator(self) -> PageNumberPaginator:
-        return PageNumberPaginator(start_value=1)
+    def get_new_paginator(self) -> TallyPaginator:
+        return TallyPaginator()
 
     @override
     def get_url_params(
@@ -302,8 +403,8 @@ class WebhooksStream(TallyStream):
     ).to_dict()
 
     @override
-    def get_new_paginator(self) -> PageNumberPaginator:
-        return PageNumberPaginator(start_value=1)
+    def get_new_paginator(self) -> TallyPaginator:
+        return TallyPaginator()
 
     @override
     def get_url_params(
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+from functools import cached_property
 from typing import TYPE_CHECKING, override
 
+import requests
+from requests.adapters import HTTPAdapter
 from singer_sdk import Tap
 from singer_sdk import typing as th  # JSON schema typing helpers
+from singer_sdk.authenticators import BearerTokenAuthenticator
+from singer_sdk.contrib.msgspec import MsgSpecWriter
 
 from tap_tally import streams
 
@@ -17,6 +22,7 @@ class TapTally(Tap):
     """Singer tap for Tally."""
 
     name = "tap-tally"
+    message_writer_class = MsgSpecWriter
 
     config_jsonschema = th.PropertiesList(
         th.Property(
@@ -37,6 +43,19 @@ class TapTally(Tap):
         ),
     ).to_dict()
 
+    @cached_property
+    def authenticator(self) -> BearerTokenAuthenticator:
+        """Authenticator shared by all streams."""
+        return BearerTokenAuthenticator(token=self.config["api_key"])
+
+    @cached_property
+    def requests_session(self) -> requests.Session:
+        """HTTP session shared by all streams, so connections to the API are reused."""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=32, max_retries=0)
+        session.mount("https://", adapter)
+        return session
+
     @override
     def discover_streams(self) -> list[TallyStream]:
         return [
@@ -0,0 +1,69 @@
+"""Fixtures for offline tests against a stubbed Tally API."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any, override
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from tap_tally.tap import TapTally
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    Route = Callable[[requests.PreparedRequest], Any]
+
+
+class StubAdapter(HTTPAdapter):
+    """Transport adapter that answers every request with the JSON body returned by a route."""
+
+    def __init__(self, route: Route) -> None:
+        """Create an adapter that answers requests with ``route``."""
+        super().__init__()
+        self.route = route
+        self.requests: list[requests.PreparedRequest] = []
+
+    @override
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        *args: Any,
+        **kwargs: Any,
+    ) -> requests.Response:
+        self.requests.append(request)
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = "application/json"
+        response._content = json.dumps(self.route(request)).encode()  # ruff: ignore[private-member-access]
+        response.url = str(request.url)
+        response.request = request
+        return response
+
+
+@pytest.fixture
+def tap() -> TapTally:
+    """Return a tap configured with a dummy API key and a fixed organization.
+
+    Returns:
+        A tap instance.
+    """
+    return TapTally(config={"api_key": "test", "organization_ids": ["org"]})
+
+
+@pytest.fixture
+def mount_stub(tap: TapTally) -> Callable[[Route], StubAdapter]:
+    """Return a function that mounts a stub adapter on the tap's shared session.
+
+    Returns:
+        A function taking the route to answer requests with.
+    """
+
+    def mount(route: Route) -> StubAdapter:
+        adapter = StubAdapter(route)
+        tap.requests_session.mount("https://", adapter)
+        return adapter
+
+    return mount
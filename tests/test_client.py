@@ -0,0 +1,60 @@
+"""Tests for the Tally REST client."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qs, urlparse
+
+from tap_tally.streams import WorkspacesStream
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import requests
+
+    from tap_tally.tap import TapTally
+    from tests.conftest import Route, StubAdapter
+
+
+def page_number(request: requests.PreparedRequest) -> int:
+    """Return the page number requested.
+
+    Returns:
+        The page number.
+    """
+    return int(parse_qs(urlparse(str(request.url)).query)["page"][0])
+
+
+def test_pagination_stops_when_has_more_is_false(
+    tap: TapTally,
+    mount_stub: Callable[[Route], StubAdapter],
+) -> None:
+    """No further page is requested after a page with ``"hasMore": false``."""
+
+    def route(request: requests.PreparedRequest) -> dict[str, Any]:
+        page = page_number(request)
+        items = [{"id": f"workspace{page}"}] if page < 3 else []
+        return {"items": items, "hasMore": page < 2}
+
+    adapter = mount_stub(route)
+    records = list(WorkspacesStream(tap).request_records(None))
+
+    assert [record["id"] for record in records] == ["workspace1", "workspace2"]
+    assert [page_number(request) for request in adapter.requests] == [1, 2]
+
+
+def test_pagination_without_has_more_stops_on_empty_page(
+    tap: TapTally,
+    mount_stub: Callable[[Route], StubAdapter],
+) -> None:
+    """Without ``hasMore``, pages are requested until one comes back empty."""
+
+    def route(request: requests.PreparedRequest) -> dict[str, Any]:
+        page = page_number(request)
+        return {"items": [{"id": f"workspace{page}"}] if page < 3 else []}
+
+    adapter = mount_stub(route)
+    records = list(WorkspacesStream(tap).request_records(None))
+
+    assert [record["id"] for record in records] == ["workspace1", "workspace2"]
+    assert [page_number(request) for request in adapter.requests] == [1, 2, 3]
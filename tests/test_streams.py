@@ -0,0 +1,99 @@
+"""Tests for fetching form child streams ahead of time."""
+
+from __future__ import annotations
+
+import json
+import time
+from typing import TYPE_CHECKING, Any, cast
+from urllib.parse import parse_qs, urlparse
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+
+    import pytest
+    import requests
+
+    from tap_tally.streams import QuestionsStream, SubmissionsStream
+    from tap_tally.tap import TapTally
+    from tests.conftest import Route, StubAdapter
+
+FORM_IDS = [f"form{i}" for i in range(12)]
+
+
+def route(request: requests.PreparedRequest) -> dict[str, Any]:
+    """Answer requests for forms and their questions and submissions.
+
+    Returns:
+        The response body.
+
+    Raises:
+        AssertionError: If the tap requests an unexpected endpoint.
+    """
+    url = urlparse(str(request.url))
+    page = int(parse_qs(url.query).get("page", ["1"])[0])
+    match url.path.split("/")[1:]:
+        case ["forms"]:
+            return {"items": [{"id": form_id} for form_id in FORM_IDS], "hasMore": False}
+        case ["forms", form_id, "questions"]:
+            # Answer earlier forms last, so prefetches complete out of order
+            time.sleep(0.001 * (len(FORM_IDS) - FORM_IDS.index(form_id)))
+            return {"questions": [{"id": f"{form_id}-question", "formId": form_id}]}
+        case ["forms", form_id, "submissions"]:
+            submission = {"id": f"{form_id}-submission{page}", "formId": form_id}
+            return {"submissions": [submission], "hasMore": page < 2}
+    msg = f"Unexpected request: {request.url}"
+    raise AssertionError(msg)
+
+
+def test_child_streams_request_form_urls(
+    tap: TapTally,
+    mount_stub: Callable[[Route], StubAdapter],
+) -> None:
+    """Child streams are requested with the ID of each form."""
+    adapter = mount_stub(route)
+    tap.streams["forms"].sync()
+
+    paths = {urlparse(str(request.url)).path for request in adapter.requests}
+    assert {f"/forms/{form_id}/questions" for form_id in FORM_IDS} <= paths
+    assert {f"/forms/{form_id}/submissions" for form_id in FORM_IDS} <= paths
+    assert not any("formId" in path for path in paths)
+
+
+def test_child_records_follow_form_order(
+    tap: TapTally,
+    mount_stub: Callable[[Route], StubAdapter],
+    capsysbinary: pytest.CaptureFixture[bytes],
+) -> None:
+    """Child records are emitted in form order, whatever order prefetches complete in."""
+    mount_stub(route)
+    tap.streams["forms"].sync()
+
+    messages = [json.loads(line) for line in capsysbinary.readouterr().out.splitlines()]
+    records = [message for message in messages if message["type"] == "RECORD"]
+    questions = [r["record"]["id"] for r in records if r["stream"] == "questions"]
+    submissions = [r["record"]["id"] for r in records if r["stream"] == "submissions"]
+
+    assert questions == [f"{form_id}-question" for form_id in FORM_IDS]
+    assert submissions == [f"{form_id}-submission{page}" for form_id in FORM_IDS for page in (1, 2)]
+
+
+def test_unconsumed_prefetches_are_discarded(
+    tap: TapTally,
+    mount_stub: Callable[[Route], StubAdapter],
+) -> None:
+    """Prefetched pages are dropped when the forms stream stops early."""
+    mount_stub(route)
+    questions = cast("QuestionsStream", tap.streams["questions"])
+    submissions = cast("SubmissionsStream", tap.streams["submissions"])
+    records = cast(
+        "Generator[dict[str, Any], None, None]",
+        tap.streams["forms"].get_records({"organizationId": "org"}),
+    )
+
+    next(records)
+    assert questions._prefetched  # ruff: ignore[private-member-access]
+    assert submissions._prefetched  # ruff: ignore[private-member-access]
+
+    records.close()
+    assert not questions._prefetched  # ruff: ignore[private-member-access]
+    assert not submissions._prefetched  # ruff: ignore[private-member-access]